@@ -0,0 +1,91 @@
+"""
+Numerical kernels for the point classes, JIT-compiled with numba when it is
+installed. numba is imported here and nowhere else, so the rest of the
+package keeps working without it — the kernels then simply run as plain
+Python functions.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels fall back to plain Python
+    njit = None
+
+
+def _jit(func):
+    """
+    Compiles func with numba (cached on disk, fastmath enabled) when numba
+    is available; otherwise returns func unchanged.
+
+    Parameters:
+        func (callable): The kernel to compile.
+
+    Returns:
+        callable: The compiled or original function.
+    """
+    if njit is None:
+        return func
+    return njit(cache=True, fastmath=True)(func)
+
+
+@_jit
+def sqdist_origin(x, y):
+    """
+    Computes the squared distance of (x, y) from the origin.
+
+    Parameters:
+        x (int | float): The x-coordinate.
+        y (int | float): The y-coordinate.
+
+    Returns:
+        int | float: x*x + y*y.
+    """
+    return x * x + y * y
+
+
+@_jit
+def sqdist(x1, y1, x2, y2):
+    """
+    Computes the squared distance between (x1, y1) and (x2, y2).
+
+    Parameters:
+        x1, y1 (int | float): Coordinates of the first point.
+        x2, y2 (int | float): Coordinates of the second point.
+
+    Returns:
+        int | float: The squared Euclidean distance.
+    """
+    dx = x1 - x2
+    dy = y1 - y2
+    return dx * dx + dy * dy
+
+
+@_jit
+def find_equal_pair_trials(target):
+    """
+    Counts how many random point-pair draws are needed before `target` pairs
+    with equal distance from the origin have been found.
+
+    Coordinates are drawn uniformly from [-100, 100], matching the Point
+    demo, and squared distances are compared so no square roots are taken.
+    The loop body is a handful of integer operations, which is exactly the
+    shape of code numba turns into a tight native loop.
+
+    Parameters:
+        target (int): Number of equal-distance pairs to find.
+
+    Returns:
+        int: Total number of pairs drawn.
+    """
+    found = 0
+    trials = 0
+    while found < target:
+        ax = np.random.randint(-100, 101)
+        ay = np.random.randint(-100, 101)
+        bx = np.random.randint(-100, 101)
+        by = np.random.randint(-100, 101)
+        trials += 1
+        if ax * ax + ay * ay == bx * bx + by * by:
+            found += 1
+    return trials
@@ -1,3 +1,6 @@
+import numpy as np
+
+from _kernels import sqdist
 from color_point import ColorPoint
 
 
@@ -7,6 +10,14 @@ class AdvancedPoint(ColorPoint):
     validation, encapsulation, and utility methods.
     """
     COLORS = ["red", "green", "blue", "black", "white"]
+    # Frozenset mirror of COLORS for O(1) membership tests in the
+    # constructor and setter; COLORS keeps the readable iteration order.
+    _COLOR_SET = frozenset(COLORS)
+
+    # Fixed attribute layout; _d2 reuses the slot inherited from Point. The
+    # x/y/color properties below shadow the parent slot descriptors, which is
+    # fine because this class stores its data under the underscored names.
+    __slots__ = ("_x", "_y", "_color")
 
     def __init__(self, x, y, color):
         """
@@ -22,17 +33,21 @@ class AdvancedPoint(ColorPoint):
             TypeError: If x or y are not int or float.
             ValueError: If color is not in the predefined COLORS list.
         """
-        if not isinstance(x, (int, float)):
-            raise TypeError("Expected a numerical type for x (int or float).")
-        if not isinstance(y, (int, float)):
-            raise TypeError("Expected a numerical type for y (int or float).")
-        if color not in self.COLORS:
+        # Type guards only run in debug mode (python -O strips them), so hot
+        # paths creating many points pay just the attribute stores below.
+        if __debug__:
+            if not isinstance(x, (int, float)):
+                raise TypeError("Expected a numerical type for x (int or float).")
+            if not isinstance(y, (int, float)):
+                raise TypeError("Expected a numerical type for y (int or float).")
+        if color not in self._COLOR_SET:
             raise ValueError(f"Unsupported color. Choose from: {self.COLORS}")
 
         # Call to parent constructor is commented out, using manual initialization.
         self._x = x
         self._y = y
         self._color = color
+        self._d2 = x * x + y * y  # Cached squared distance used by Point comparisons
 
     @property
     def x(self):
@@ -75,7 +90,7 @@ class AdvancedPoint(ColorPoint):
         Raises:
             ValueError: If new_color is not in the valid COLORS list.
         """
-        if new_color not in AdvancedPoint.COLORS:
+        if new_color not in AdvancedPoint._COLOR_SET:
             raise ValueError(f"Invalid color. Choose from: {AdvancedPoint.COLORS}")
         self._color = new_color
 
@@ -91,6 +106,7 @@ class AdvancedPoint(ColorPoint):
             None
         """
         cls.COLORS.append(new_color)
+        cls._COLOR_SET = frozenset(cls.COLORS)  # Keep the fast lookup in sync
 
     @staticmethod
     def distance_2_points(p1, p2):
@@ -104,7 +120,32 @@ class AdvancedPoint(ColorPoint):
         Returns:
             float: The Euclidean distance between the two points.
         """
-        return ((p1.x - p2.x) ** 2 + (p1.y - p2.y) ** 2) ** 0.5
+        return sqdist(p1.x, p1.y, p2.x, p2.y) ** 0.5
+
+    @staticmethod
+    def distances_matrix(points):
+        """
+        Computes the full pairwise distance matrix for a sequence of points
+        in one vectorized NumPy operation.
+
+        Where distance_2_points handles a single pair through Python
+        attribute access, this stacks all coordinates into an (N, 2) array
+        and lets broadcasting produce every pairwise difference at once, so
+        the N^2 distances are computed in C instead of in a Python loop.
+
+        Parameters:
+            points (sequence[Point]): Points exposing x and y attributes.
+
+        Returns:
+            numpy.ndarray: An (N, N) array where entry [i, j] is the
+                           Euclidean distance between points i and j.
+        """
+        coords = np.fromiter(
+            (value for point in points for value in (point.x, point.y)),
+            dtype=np.float64,
+        ).reshape(-1, 2)
+        diff = coords[:, None, :] - coords[None, :, :]
+        return np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
 
     @staticmethod
     def from_dictionary(data):
@@ -147,4 +188,7 @@ p4 = AdvancedPoint.from_dictionary({})  # Uses all defaults: x=10, y=20, color=b
 print(p4)
 
 p5 = AdvancedPoint.from_dictionary({"x": 44})  # Overrides x only
-print(p5)
\ No newline at end of file
+print(p5)
+
+# All pairwise distances between the demo points in a single array operation
+print(AdvancedPoint.distances_matrix([p2, p3, p4, p5]))
\ No newline at end of file
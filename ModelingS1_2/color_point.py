@@ -1,12 +1,13 @@
 from simplepoint import Point #point is file, Point is the class
 import random
 class ColorPoint(Point): #Inherits from Point class to avoid duplication and expands functionality of the code
+    __slots__=("color",) #only the new attribute; x, y and _d2 live in Point's slots
+
     def __init__(self,x,y,color):
         """
         Define a color point x,y color
         """
-        self.x=x
-        self.y=y
+        super().__init__(x,y) #lets Point set up x, y and the cached distance
         self.color=color
 
     def __str__(self):
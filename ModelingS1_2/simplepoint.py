@@ -1,4 +1,7 @@
-import random
+import numpy as np
+
+from _kernels import sqdist_origin
+
 
 class Point:
     """
@@ -6,6 +9,10 @@ class Point:
     Includes comparison operators based on distance from the origin (0, 0).
     """
 
+    # Fixed attribute layout: drops the per-instance __dict__ (~hundreds of
+    # bytes each), which matters when Monte-Carlo loops allocate many points.
+    __slots__ = ("x", "y", "_d2")
+
     def __init__(self, x, y):
         """
         Initializes a Point instance with x and y coordinates.
@@ -16,6 +23,11 @@ class Point:
         """
         self.x = x
         self.y = y
+        # Squared distance from the origin, computed once by the shared
+        # kernel. Comparisons use this directly, which skips the sqrt
+        # entirely (monotonic for non-negative values, so orderings are
+        # unchanged).
+        self._d2 = sqdist_origin(x, y)
 
     def __str__(self):
         """
@@ -43,7 +55,7 @@ class Point:
         Returns:
             float: Distance from origin.
         """
-        return (self.x**2 + self.y**2) ** 0.5
+        return self._d2 ** 0.5
 
     def __gt__(self, other):
         """
@@ -55,7 +67,7 @@ class Point:
         Returns:
             bool: True if this point is farther from the origin than the other.
         """
-        return self.distance_from_origin() > other.distance_from_origin()
+        return self._d2 > other._d2
 
     def __eq__(self, other):
         """
@@ -68,7 +80,85 @@ class Point:
         Returns:
             bool: True if distances from origin are equal.
         """
-        return self.distance_from_origin() == other.distance_from_origin()
+        return self._d2 == other._d2
+
+
+class PointArray:
+    """
+    Struct-of-arrays container for a batch of 2D points. Instead of N Point
+    objects (array-of-structs), the coordinates live in two parallel NumPy
+    arrays, so bulk operations — generation, distance computation, sorting —
+    run as single C-level array calls rather than per-object Python code.
+    """
+
+    __slots__ = ("xs", "ys")
+
+    def __init__(self, xs, ys):
+        """
+        Initializes a PointArray from two coordinate sequences.
+
+        Parameters:
+            xs (array-like): The x-coordinates.
+            ys (array-like): The y-coordinates, same length as xs.
+        """
+        self.xs = np.asarray(xs, dtype=np.float64)
+        self.ys = np.asarray(ys, dtype=np.float64)
+
+    @classmethod
+    def random(cls, n, low=-100, high=100):
+        """
+        Creates n points with integer coordinates drawn uniformly from
+        [low, high], generated in one batched RNG call.
+
+        Parameters:
+            n (int): Number of points to generate.
+            low (int): Smallest coordinate value (inclusive).
+            high (int): Largest coordinate value (inclusive).
+
+        Returns:
+            PointArray: A new array of n random points.
+        """
+        return cls(np.random.randint(low, high + 1, n),
+                   np.random.randint(low, high + 1, n))
+
+    def __len__(self):
+        """Returns the number of points in the array."""
+        return len(self.xs)
+
+    def __str__(self):
+        """
+        Returns a string representation matching how a list of Points prints.
+
+        Returns:
+            str: The points formatted as [<x, y>, ...].
+        """
+        pairs = ", ".join(f"<{int(x)}, {int(y)}>"
+                          for x, y in zip(self.xs, self.ys))
+        return f"[{pairs}]"
+
+    def distances_from_origin(self):
+        """
+        Computes every point's distance from the origin in one vectorized
+        operation.
+
+        Returns:
+            numpy.ndarray: Array of Euclidean distances, one per point.
+        """
+        return np.sqrt(self.xs * self.xs + self.ys * self.ys)
+
+    def sort_by_distance(self):
+        """
+        Reorders the points in place by their distance from the origin,
+        matching the ordering that list.sort() gives a list of Points.
+
+        Returns:
+            None
+        """
+        # Squared distance orders identically to distance; argsort once and
+        # apply the same permutation to both coordinate arrays.
+        order = np.argsort(self.xs * self.xs + self.ys * self.ys)
+        self.xs = self.xs[order]
+        self.ys = self.ys[order]
 
 
 # --- Script execution (not part of class) ---
@@ -80,22 +170,16 @@ if __name__ == "__main__":
     print(f"p1 coordinates: x={p1.x}, y={p1.y}")
     print(f"p1 as string: {p1}")
 
-    # Generate a list of 5 random points
+    # Generate a batch of 5 random points (coordinates held in NumPy arrays)
     print("\nGenerating 5 random points:")
-    points = []
-    for i in range(5):
-        rand_point = Point(
-            random.randint(-100, 100),
-            random.randint(-100, 100)
-        )
-        points.append(rand_point)
-
-    # Print the unsorted list of points
+    points = PointArray.random(5)
+
+    # Print the unsorted batch of points
     print("Unsorted points:")
     print(points)
 
     # Sort the points based on their distance from origin
-    points.sort()
+    points.sort_by_distance()
     print("Sorted points by distance from origin:")
     print(points)
 
@@ -108,17 +192,34 @@ if __name__ == "__main__":
     p2 = (7, 7)
     print(f"Tuple comparison using __gt__: {p1.__gt__(p2)}")
 
-    # Experimental section to find how often two random points are equal (by distance)
+    # Experimental section to find how often two random points are equal (by
+    # distance). Trials are vectorized: each batch draws both pairs' worth of
+    # coordinates in one RNG call and compares squared distances array-wide;
+    # only the matching rows are materialized as Point objects for printing.
     print("\nSearching for point pairs with equal distance from origin...")
+    rng = np.random.default_rng()
+    target = 10
+    batch = 100_000
     found_equal = 0
     trials = 0
-    while found_equal < 10:
-        point_a = Point(random.randint(-100, 100), random.randint(-100, 100))
-        point_b = Point(random.randint(-100, 100), random.randint(-100, 100))
-        trials += 1
-        if point_a == point_b:
+    while found_equal < target:
+        xy = rng.integers(-100, 101, size=(batch, 4))
+        d2_a = xy[:, 0] ** 2 + xy[:, 1] ** 2
+        d2_b = xy[:, 2] ** 2 + xy[:, 3] ** 2
+        hits = np.flatnonzero(d2_a == d2_b)[:target - found_equal]
+
+        for row in hits:
+            point_a = Point(int(xy[row, 0]), int(xy[row, 1]))
+            point_b = Point(int(xy[row, 2]), int(xy[row, 3]))
             print(f"Equal pair found: {point_a} and {point_b}")
-            found_equal += 1
+
+        if found_equal + len(hits) >= target:
+            # Stop counting at the trial that produced the final pair, like
+            # the original one-at-a-time loop did.
+            trials += int(hits[-1]) + 1
+        else:
+            trials += batch
+        found_equal += len(hits)
 
     probability_estimate = trials / found_equal
     print(f"\nEstimated probability of equality: 1 in {probability_estimate:.2f}")
\ No newline at end of file
@@ -1,4 +1,5 @@
 import random
+from array import array
 
 class Card:
     """
@@ -9,6 +10,17 @@ class Card:
     RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
     SUITS = ["♣", "♦", "♥", "♠"]  # Clubs, Diamonds, Hearts, Spades
 
+    # Fixed attribute layout: no per-instance __dict__, so each of the 52
+    # cards allocated per deck is a fraction of its former size and attribute
+    # access is a fixed-offset read.
+    __slots__ = ("_rank", "_suit", "_rank_idx", "_suit_idx")
+
+    # Rank/suit -> position lookups built once at class creation. Comparisons
+    # and hashing use these O(1) dict probes instead of scanning the lists
+    # with list.index().
+    _RANK_IDX = {rank: index for index, rank in enumerate(RANKS)}
+    _SUIT_IDX = {suit: index for index, suit in enumerate(SUITS)}
+
     def __init__(self, rank, suit):
         """
         Initializes a Card instance after validating the given rank and suit.
@@ -26,6 +38,10 @@ class Card:
             raise ValueError(f"Invalid suit '{suit}'. Must be one of: {self.SUITS}")
         self._rank = rank
         self._suit = suit
+        # Plain int keys so comparisons, hashing and flush checks are a
+        # single attribute load plus an int operation.
+        self._rank_idx = Card._RANK_IDX[rank]
+        self._suit_idx = Card._SUIT_IDX[suit]
 
     @property
     def rank(self):
@@ -66,7 +82,17 @@ class Card:
         Returns:
             bool: True if ranks are equal, False otherwise.
         """
-        return self.rank == other.rank
+        return self._rank_idx == other._rank_idx
+
+    def __hash__(self):
+        """
+        Hashes the card by its rank index, consistent with __eq__ (cards of
+        equal rank compare equal and therefore hash equal).
+
+        Returns:
+            int: Hash of the card's rank position.
+        """
+        return self._rank_idx
 
     def __lt__(self, other):
         """
@@ -78,7 +104,7 @@ class Card:
         Returns:
             bool: True if self's rank is less than other's.
         """
-        return self.RANKS.index(self.rank) < self.RANKS.index(other.rank)
+        return self._rank_idx < other._rank_idx
 
     def __gt__(self, other):
         """
@@ -90,7 +116,13 @@ class Card:
         Returns:
             bool: True if self's rank is greater than other's.
         """
-        return self.RANKS.index(self.rank) > self.RANKS.index(other.rank)
+        return self._rank_idx > other._rank_idx
+
+
+# Canonical ordered deck, built (and validated) exactly once at import time.
+# Card instances are immutable, so every Deck can safely share them and just
+# copy this list instead of re-running 52 Card constructions per deck.
+_TEMPLATE = [Card(rank, suit) for suit in Card.SUITS for rank in Card.RANKS]
 
 
 class Deck:
@@ -99,12 +131,15 @@ class Deck:
     Provides methods for shuffling and dealing cards.
     """
 
+    __slots__ = ("_cards",)
+
     def __init__(self):
         """
-        Initializes the deck by creating all 52 card combinations (one of each rank and suit).
-        Stores them in a private list attribute.
+        Initializes the deck with all 52 card combinations (one of each rank
+        and suit) by copying the module-level template, avoiding 52 Card
+        constructions and their rank/suit validation per deck.
         """
-        self._cards = [Card(rank, suit) for suit in Card.SUITS for rank in Card.RANKS]
+        self._cards = _TEMPLATE.copy()
 
     @property
     def cards(self):
@@ -131,12 +166,67 @@ class Deck:
 
     def deal(self):
         """
-        Removes and returns the top card of the deck (first in list).
+        Removes and returns the top card of the deck (last in list).
+
+        Dealing from the tail keeps pop() O(1); popping from the front would
+        shift every remaining card pointer on each deal.
 
         Returns:
             Card: The card at the top of the deck.
         """
-        return self._cards.pop(0)
+        return self._cards.pop()
+
+
+class FastDeck:
+    """
+    A compact deck for bulk simulation: the 52 cards are stored as their
+    indices 0-51 in a byte array (52 bytes total, versus a list of 52 Card
+    pointers), so shuffling moves single bytes instead of object references.
+    Index i encodes suit SUITS[i // 13] and rank RANKS[i % 13]; use card()
+    to translate an index back into a Card only when a readable card is
+    actually needed.
+    """
+
+    __slots__ = ("_idx",)
+
+    def __init__(self):
+        """
+        Initializes the deck with the 52 card indices in canonical order.
+        """
+        self._idx = array("b", range(52))
+
+    def shuffle(self):
+        """
+        Randomly shuffles the order of card indices in the deck.
+
+        Returns:
+            None
+        """
+        random.shuffle(self._idx)
+
+    def deal5(self):
+        """
+        Removes and returns the top five card indices of the deck.
+
+        Returns:
+            array: The five dealt card indices.
+        """
+        dealt = self._idx[-5:]
+        del self._idx[-5:]
+        return dealt
+
+    @staticmethod
+    def card(index):
+        """
+        Translates a card index back into its (shared, immutable) Card.
+
+        Parameters:
+            index (int): A card index in the range 0-51.
+
+        Returns:
+            Card: The corresponding card from the canonical deck.
+        """
+        return _TEMPLATE[index]
 
 
 # --- Example usage for testing and demonstration ---
@@ -161,4 +251,10 @@ if __name__ == "__main__":
     top_card = deck.deal()
     print("\nDealt top card:", top_card)
     print("\nDeck after dealing one card:")
-    print(deck)
\ No newline at end of file
+    print(deck)
+
+    # Deal five cards from the compact index-based deck
+    fast_deck = FastDeck()
+    fast_deck.shuffle()
+    hand_indices = fast_deck.deal5()
+    print("\nFastDeck hand:", [FastDeck.card(i) for i in hand_indices])
\ No newline at end of file